@@ -1,12 +1,10 @@
 import streamlit as st
 import pandas as pd
 import json
-import os
-import re
-from io import BytesIO
-import base64
+from concurrent.futures import ThreadPoolExecutor
 
 from scraper.scraper import scrape_website
+from scraper.design_elements import MAX_COLORS
 from scraper.utils import load_profiles, load_fields, validate_url
 
 # Page config
@@ -21,9 +19,40 @@ st.set_page_config(
 st.title("🔍 AD.IT.ASAP Web Scraper")
 st.markdown("Extract business information and design elements from websites")
 
-# Load configurations
-profiles = load_profiles()
-fields = load_fields()
+# Maximum number of websites scraped at the same time
+MAX_WORKERS = 10
+
+@st.cache_data(show_spinner=False)
+def get_profiles():
+    """Load profile configurations once per process"""
+    return load_profiles()
+
+@st.cache_data(show_spinner=False)
+def get_fields():
+    """Load field configurations once per process"""
+    return load_fields()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_scrape_website(url, profile, do_extract_colors, do_extract_logo, do_extract_fonts):
+    """Scrape a website, reusing results for the same URL and options for an hour"""
+    return scrape_website(
+        url=url,
+        profile=profile,
+        do_extract_colors=do_extract_colors,
+        do_extract_logo=do_extract_logo,
+        do_extract_fonts=do_extract_fonts
+    )
+
+def scrape_url(url, profile, do_extract_colors, do_extract_logo, do_extract_fonts):
+    """Scrape one website from a worker thread, returning the error instead of raising it"""
+    try:
+        return cached_scrape_website(url, profile, do_extract_colors, do_extract_logo, do_extract_fonts)
+    except Exception as e:
+        return e
+
+# Load configurations (st.cache_data hands out a fresh copy on every call)
+profiles = get_profiles()
+fields = get_fields()
 
 # Sidebar for configuration
 with st.sidebar:
@@ -60,99 +89,141 @@ with st.sidebar:
     
     # Advanced options
     st.subheader("Advanced Options")
-    extract_colors = st.checkbox("Extract color palette", value=True)
-    extract_logo = st.checkbox("Extract logo", value=True)
-    extract_fonts = st.checkbox("Identify fonts", value=True)
+    do_extract_colors = st.checkbox("Extract color palette", value=True)
+    do_extract_logo = st.checkbox("Extract logo", value=True)
+    do_extract_fonts = st.checkbox("Identify fonts", value=True)
 
 # Main content
-st.header("Website to Scrape")
+st.header("Websites to Scrape")
 
-url = st.text_input("Enter website URL", placeholder="https://example.com")
-
-col1, col2 = st.columns([1, 2])
-with col1:
-    start_scrape = st.button("Start Scraping", type="primary")
+# Inside a form, typing URLs doesn't rerun the script until the form is submitted
+with st.form("scrape_form"):
+    urls_text = st.text_area(
+        "Enter website URLs (one per line)",
+        placeholder="https://example.com\nhttps://another-example.com"
+    )
+    start_scrape = st.form_submit_button("Start Scraping", type="primary")
 
 # Display scraping results
-if start_scrape and url:
-    # Validate URL
-    if not validate_url(url):
-        st.error("Please enter a valid URL (include http:// or https://)")
-    else:
-        with st.spinner("Scraping website... This may take a moment."):
-            try:
-                # Start scraping
-                results, design_info = scrape_website(
-                    url=url,
-                    profile=selected_profile,
-                    extract_colors=extract_colors,
-                    extract_logo=extract_logo,
-                    extract_fonts=extract_fonts
-                )
-                
-                # Show results
-                st.header("Scraping Results")
-                
-                # Basic info
-                st.subheader("Business Information")
-                
-                # Create two columns for displaying info and design elements
-                col1, col2 = st.columns([3, 2])
-                
-                with col1:
-                    # Display result table
-                    if results:
-                        # Convert to DataFrame for display
-                        df = pd.DataFrame(list(results.items()), columns=["Field", "Value"])
-                        st.dataframe(df, use_container_width=True)
-                        
-                        # Export options
-                        st.subheader("Export Data")
-                        export_format = st.radio("Export Format", options=["JSON", "CSV"], horizontal=True)
-                        
-                        if export_format == "JSON":
-                            json_data = json.dumps(results, ensure_ascii=False, indent=2)
-                            b64 = base64.b64encode(json_data.encode()).decode()
-                            href = f'<a href="data:file/json;base64,{b64}" download="scraped_data.json">Download JSON</a>'
-                            st.markdown(href, unsafe_allow_html=True)
-                        else: # CSV
-                            csv = df.to_csv(index=False)
-                            b64 = base64.b64encode(csv.encode()).decode()
-                            href = f'<a href="data:file/csv;base64,{b64}" download="scraped_data.csv">Download CSV</a>'
-                            st.markdown(href, unsafe_allow_html=True)
-                    else:
-                        st.warning("No data was extracted. Try another URL or different profile.")
-                
-                with col2:
-                    # Display design elements
-                    st.subheader("Design Elements")
-                    
-                    # Logo
-                    if 'logo_url' in design_info and design_info['logo_url']:
-                        st.markdown("### Logo")
-                        st.markdown(f"![Logo]({design_info['logo_url']})")
+if start_scrape and urls_text.strip():
+    # Validate URLs, ignoring blank lines and duplicates
+    urls = list(dict.fromkeys(line.strip() for line in urls_text.splitlines() if line.strip()))
+    invalid_urls = [url for url in urls if not validate_url(url)]
+    urls = [url for url in urls if validate_url(url)]
+    
+    # With no valid URL left, the error below already covers them
+    if invalid_urls and urls:
+        st.error(f"Skipping invalid URLs (include http:// or https://): {', '.join(invalid_urls)}")
+    
+    if urls:
+        with st.spinner(f"Scraping {len(urls)} website(s)... This may take a moment."):
+            # Start scraping, several sites at once since most of the time is spent waiting on the network
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(urls))) as executor:
+                outcomes = list(executor.map(
+                    lambda url: scrape_url(url, selected_profile, do_extract_colors, do_extract_logo, do_extract_fonts),
+                    urls
+                ))
+        
+        scraped = {}
+        for url, outcome in zip(urls, outcomes):
+            if isinstance(outcome, Exception):
+                st.error(f"An error occurred while scraping {url}: {str(outcome)}")
+            else:
+                scraped[url] = outcome
+        
+        if scraped:
+            # Show results
+            st.header("Scraping Results")
+            
+            # Basic info
+            st.subheader("Business Information")
+            
+            # Create two columns for displaying info and design elements
+            col1, col2 = st.columns([3, 2])
+            
+            with col1:
+                # Display result table, gathered column by column
+                urls_col, fields_col, values_col = [], [], []
+                for url, (results, _) in scraped.items():
+                    urls_col.extend([url] * len(results))
+                    fields_col.extend(results.keys())
+                    values_col.extend(results.values())
+                if urls_col:
+                    # Convert to DataFrame for display
+                    df = pd.DataFrame({"URL": urls_col, "Field": fields_col, "Value": values_col})
+                    st.dataframe(df, use_container_width=True)
                     
-                    # Color palette
-                    if 'colors' in design_info and design_info['colors']:
-                        st.markdown("### Color Palette")
-                        color_cols = st.columns(len(design_info['colors']))
-                        for i, color in enumerate(design_info['colors']):
-                            with color_cols[i]:
-                                st.markdown(
-                                    f'<div style="background-color: {color}; height: 50px; border-radius: 5px;"></div>',
-                                    unsafe_allow_html=True
-                                )
-                                st.code(color)
+                    # Export options; the buttons don't rerun the script, which would clear these results
+                    st.subheader("Export Data")
+                    json_col, csv_col, parquet_col = st.columns(3)
                     
-                    # Fonts
-                    if 'fonts' in design_info and design_info['fonts']:
-                        st.markdown("### Fonts")
-                        for font in design_info['fonts']:
-                            st.markdown(f"* {font}")
+                    with json_col:
+                        st.download_button(
+                            "Download JSON",
+                            data=json.dumps(
+                                {url: results for url, (results, _) in scraped.items()},
+                                ensure_ascii=False, indent=2
+                            ).encode('utf-8'),
+                            file_name="scraped_data.json",
+                            mime="application/json",
+                            on_click="ignore"
+                        )
+                    with csv_col:
+                        st.download_button(
+                            "Download CSV",
+                            data=df.to_csv(index=False).encode('utf-8'),
+                            file_name="scraped_data.csv",
+                            mime="text/csv",
+                            on_click="ignore"
+                        )
+                    with parquet_col:
+                        # Parquet needs one type per column, so store lists/dicts as JSON text
+                        parquet_df = df.assign(Value=df["Value"].map(
+                            lambda v: v if isinstance(v, str) else json.dumps(v, ensure_ascii=False)
+                        ))
+                        st.download_button(
+                            "Download Parquet",
+                            data=parquet_df.to_parquet(index=False),
+                            file_name="scraped_data.parquet",
+                            mime="application/vnd.apache.parquet",
+                            on_click="ignore"
+                        )
+                else:
+                    st.warning("No data was extracted. Try another URL or different profile.")
+            
+            with col2:
+                # Display design elements
+                st.subheader("Design Elements")
                 
-            except Exception as e:
-                st.error(f"An error occurred during scraping: {str(e)}")
-                st.error("Please check the URL and try again.")
+                for url, (_, design_info) in scraped.items():
+                    with st.expander(url, expanded=len(scraped) == 1):
+                        # Logo
+                        if 'logo_url' in design_info and design_info['logo_url']:
+                            st.markdown("### Logo")
+                            st.markdown(f"![Logo]({design_info['logo_url']})")
+                        
+                        # Color palette
+                        if 'colors' in design_info and design_info['colors']:
+                            st.markdown("### Color Palette")
+                            # Render all swatches in a single element instead of two widgets per color
+                            swatches = ''.join(
+                                f'<div title="{color}" style="text-align: center; font-family: monospace; font-size: 0.8em;">'
+                                f'<div style="background-color: {color}; width: 56px; height: 50px; border-radius: 5px;"></div>'
+                                f'{color}</div>'
+                                for color in design_info['colors'][:MAX_COLORS]
+                            )
+                            st.markdown(
+                                f'<div style="display: flex; gap: 6px; flex-wrap: wrap;">{swatches}</div>',
+                                unsafe_allow_html=True
+                            )
+                        
+                        # Fonts
+                        if 'fonts' in design_info and design_info['fonts']:
+                            st.markdown("### Fonts")
+                            for font in design_info['fonts']:
+                                st.markdown(f"* {font}")
+    else:
+        st.error("Please enter a valid URL (include http:// or https://)")
 
 # Add footer
 st.markdown("---")
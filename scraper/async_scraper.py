@@ -0,0 +1,100 @@
+import asyncio
+import logging
+
+import httpx
+
+from .utils import HEADERS
+
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying: rate limiting and server-side errors
+RETRY_STATUS_CODES = frozenset((429, 500, 502, 503, 504))
+
+class AsyncScraper:
+    """
+    Shared async HTTP client for fetching pages and stylesheets
+    
+    Every request made through one instance goes over the same connection
+    pool, so TCP and TLS handshakes are paid once per host instead of once
+    per request. Use it as an async context manager:
+        
+        async with AsyncScraper() as fetcher:
+            texts = await fetcher.fetch_all(urls)
+    """
+    
+    def __init__(self, max_concurrent=10, timeout=10, retries=2, backoff=0.5):
+        """
+        Args:
+            max_concurrent (int): Maximum number of requests in flight
+            timeout (float): Timeout per request in seconds
+            retries (int): Extra attempts for failed requests
+            backoff (float): Initial delay between attempts, doubled after each retry
+        """
+        self.max_concurrent = max_concurrent
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.client = None
+        self.semaphore = None
+    
+    async def __aenter__(self):
+        self.client = httpx.AsyncClient(
+            http2=True,
+            headers=HEADERS,
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=30),
+        )
+        self.semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.client.aclose()
+        self.client = None
+    
+    async def fetch(self, url, headers=None):
+        """
+        Fetch a URL, retrying transient failures with exponential backoff
+        
+        Args:
+            url (str): URL to fetch
+            headers (dict): Extra request headers
+        
+        Returns:
+            httpx.Response: Successful response
+        """
+        async with self.semaphore:
+            for attempt in range(self.retries + 1):
+                last_attempt = attempt == self.retries
+                try:
+                    response = await self.client.get(url, headers=headers)
+                except httpx.TransportError:
+                    if last_attempt:
+                        raise
+                else:
+                    if response.status_code not in RETRY_STATUS_CODES or last_attempt:
+                        # 304 answers a conditional request, it is not an error
+                        if response.status_code != 304:
+                            response.raise_for_status()
+                        return response
+                await asyncio.sleep(self.backoff * 2 ** attempt)
+    
+    async def fetch_all(self, urls):
+        """
+        Fetch several URLs concurrently and return the text of the ones that succeeded
+        
+        Args:
+            urls (list): URLs to fetch
+        
+        Returns:
+            list: Response bodies, failed URLs are logged and skipped
+        """
+        results = await asyncio.gather(*(self.fetch(url) for url in urls), return_exceptions=True)
+        
+        texts = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Could not fetch {url}: {str(result)}")
+            else:
+                texts.append(result.text)
+        return texts
@@ -1,18 +1,133 @@
-from bs4 import BeautifulSoup
 import re
-import requests
 from urllib.parse import urljoin
 import logging
-from io import BytesIO
-from PIL import Image
-import base64
-import cssutils
 import colorsys
+from functools import lru_cache
+import numpy as np
 
-# Suppress cssutils logging
-cssutils.log.setLevel(logging.CRITICAL)
+from .css_colors import CSS_NAMED_COLORS
 
-def extract_color_palette(soup, html_content, max_colors=5):
+# Precompiled patterns
+HEX_RE = re.compile(r'#(?:[0-9a-fA-F]{8}|[0-9a-fA-F]{6}|[0-9a-fA-F]{3})\b')
+RGB_RE = re.compile(r'rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*[,)]')
+HSL_RE = re.compile(r'hsla?\(\s*(\d+(?:\.\d+)?)(?:deg)?\s*,\s*(\d+(?:\.\d+)?)%\s*,\s*(\d+(?:\.\d+)?)%')
+# All color notations in a single sweep; url(...) is matched only so that
+# file names like red.png are not mistaken for named colors, and names must
+# stand alone so parts of identifiers like var(--brand-red) are skipped too
+COLOR_RE = re.compile(
+    f'(?P<hex>{HEX_RE.pattern})|(?P<rgb>{RGB_RE.pattern})|(?P<hsl>{HSL_RE.pattern})'
+    r'|(?P<url>url\([^)]*\))|(?P<name>(?<![\w-])[a-zA-Z]+(?![\w-]))'
+)
+# Values of color/background declarations (background-color, border-color, ...)
+CSS_COLOR_DECL_RE = re.compile(r'(?:background|color)[^:;{}]*:\s*([^;}]+)', re.I)
+CSS_COLOR_VAR_RE = re.compile(r'--(?:primary|secondary|accent|main|brand)(?:-color)?\s*:\s*([^;]+)')
+# @font-face names, font CSS variables and font-family declarations in a single sweep
+FONT_ALL_RE = re.compile(
+    r'@font-face\s*{[^}]*?font-family\s*:\s*[\'"](?P<face>[^\'"]+)[\'"]'
+    r'|--(?:font|typography)-family(?:-[a-z]+)?\s*:\s*(?P<var>[^;}]+)'
+    r'|font-family\s*:\s*(?P<family>[^;}]+)'
+)
+GOOGLE_FONT_SPEC_RE = re.compile(r':[^,]+')
+LOGO_RE = re.compile(r'logo', re.I)
+HEADER_RE = re.compile(r'header', re.I)
+
+# Stylesheets served from these hosts are libraries or fonts, not the site's own palette
+CDN_HOSTS = ('googleapis', 'cdnjs', 'cloudflare')
+
+# Generic CSS font families that say nothing about the site's typography
+GENERIC_FAMILIES = frozenset(('sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', ''))
+
+# Default number of colors in an extracted palette
+MAX_COLORS = 5
+
+# Colors that never make it into a palette
+BLACKLIST = frozenset(('#000000', '#ffffff'))
+
+@lru_cache(maxsize=1024)
+def _rgb_to_hex(r, g, b):
+    """Convert rgb() channel strings to a #rrggbb code (sites reuse the same triples a lot)"""
+    return '#' + bytes((min(int(r), 255), min(int(g), 255), min(int(b), 255))).hex()
+
+def find_colors(text):
+    """
+    Find all colors in a CSS snippet
+    
+    Handles #rgb, #rrggbb, #rrggbbaa, rgb()/rgba(), hsl()/hsla() and CSS
+    named colors. Alpha channels are dropped.
+    
+    Args:
+        text (str): CSS text to scan
+        
+    Returns:
+        list: List of lowercase #rrggbb color codes
+    """
+    colors = []
+    # Groups 3-5 hold the rgb() channels and groups 7-9 the hsl() channels
+    for match in COLOR_RE.finditer(text):
+        kind = match.lastgroup
+        if kind == 'hex':
+            color = match.group(0).lower()
+            if len(color) == 4:  # Expand #rgb to #rrggbb
+                color = '#' + color[1] * 2 + color[2] * 2 + color[3] * 2
+            colors.append(color[:7])
+        elif kind == 'rgb':
+            colors.append(_rgb_to_hex(*match.group(3, 4, 5)))
+        elif kind == 'hsl':
+            h, s, l = (float(value) for value in match.group(7, 8, 9))
+            r, g, b = colorsys.hls_to_rgb(h / 360 % 1, min(l, 100) / 100, min(s, 100) / 100)
+            colors.append('#' + bytes((round(r * 255), round(g * 255), round(b * 255))).hex())
+        elif kind == 'name':
+            named = CSS_NAMED_COLORS.get(match.group(0).lower())
+            if named:
+                colors.append(named)
+    return colors
+
+# The style and link lookups below use find_all rather than soup.select: selectors are
+# matched by soupsieve in pure Python and are several times slower on large pages
+def get_style_text(soup):
+    """
+    Collect the contents of all style tags
+    
+    Args:
+        soup (BeautifulSoup): Parsed HTML
+        
+    Returns:
+        str: Concatenated CSS text
+    """
+    return "\n".join(tag.string for tag in soup.find_all('style') if tag.string)
+
+def get_stylesheet_urls(soup, base_url):
+    """
+    Collect the URLs of the site's own linked stylesheets
+    
+    Args:
+        soup (BeautifulSoup): Parsed HTML
+        base_url (str): Base URL for resolving relative links
+        
+    Returns:
+        list: Absolute stylesheet URLs, external CDN stylesheets excluded
+    """
+    return list(dict.fromkeys(
+        urljoin(base_url, link['href'])
+        for link in soup.find_all('link', href=True)
+        if 'stylesheet' in (rel.lower() for rel in link.get('rel') or ())
+        and not any(cdn in link['href'] for cdn in CDN_HOSTS)
+    ))
+
+def get_inline_styles(soup):
+    """
+    Collect the style attributes of all elements
+    
+    Args:
+        soup (BeautifulSoup): Parsed HTML
+        
+    Returns:
+        str: Inline style declarations, one element per line
+    """
+    # Terminate each element's declarations so the last one never runs into the next element
+    return ";\n".join(element['style'] for element in soup.find_all(style=True))
+
+def extract_color_palette(soup, html_content, max_colors=MAX_COLORS, style_text=None, inline_styles=None):
     """
     Extract dominant colors from a website
     
@@ -20,125 +135,91 @@ def extract_color_palette(soup, html_content, max_colors=5):
         soup (BeautifulSoup): Parsed HTML
         html_content (str): Raw HTML content
         max_colors (int): Maximum number of colors to extract
+        style_text (str): Contents of the style tags, see get_style_text
+        inline_styles (str): Inline style attributes, see get_inline_styles
         
     Returns:
         list: List of hex color codes
     """
-    colors = []
+    colors = set()
     
     # Extract colors from CSS
     try:
-        # Find all style tags
-        for style_tag in soup.find_all('style'):
-            if style_tag.string:
-                style_content = style_tag.string
-                # Parse the CSS
-                sheet = cssutils.parseString(style_content)
-                # Extract colors from each rule
-                for rule in sheet:
-                    if hasattr(rule, 'style'):
-                        for property_name in rule.style:
-                            property_value = rule.style[property_name]
-                            # Check if the property value contains a color
-                            if 'color' in property_name or 'background' in property_name:
-                                # Extract hex colors
-                                hex_colors = re.findall(r'#(?:[0-9a-fA-F]{3}){1,2}', property_value)
-                                colors.extend(hex_colors)
-                                # Extract rgb/rgba colors
-                                rgb_colors = re.findall(r'rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)', property_value)
-                                for r, g, b in rgb_colors:
-                                    hex_color = '#{:02x}{:02x}{:02x}'.format(int(r), int(g), int(b))
-                                    colors.append(hex_color)
+        # Collect the text of all style tags and inline styles
+        if style_text is None:
+            style_text = get_style_text(soup)
+        if inline_styles is None:
+            inline_styles = get_inline_styles(soup)
         
-        # Find inline styles
-        elements_with_style = soup.find_all(style=True)
-        for element in elements_with_style:
-            style_content = element['style']
-            # Extract hex colors
-            hex_colors = re.findall(r'#(?:[0-9a-fA-F]{3}){1,2}', style_content)
-            colors.extend(hex_colors)
-            # Extract rgb/rgba colors
-            rgb_colors = re.findall(r'rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)', style_content)
-            for r, g, b in rgb_colors:
-                hex_color = '#{:02x}{:02x}{:02x}'.format(int(r), int(g), int(b))
-                colors.append(hex_color)
-                
-        # Find linked stylesheets
-        for link in soup.find_all('link', rel='stylesheet'):
-            if 'href' in link.attrs:
-                # Skip external CDN stylesheets
-                if not any(cdn in link['href'] for cdn in ['googleapis', 'cdnjs', 'cloudflare']):
-                    continue
+        # Only look at color/background declarations, scanning both texts in place instead of joining them
+        for text in (style_text, inline_styles):
+            for match in CSS_COLOR_DECL_RE.finditer(text):
+                colors.update(find_colors(match.group(1)))
     
     except Exception as e:
         logging.warning(f"Error extracting colors from CSS: {str(e)}")
     
-    # Normalize colors (lowercase, remove duplicates)
-    colors = [c.lower() for c in colors]
-    unique_colors = list(set(colors))
-    
-    # Filter out black, white, transparent
-    filtered_colors = [c for c in unique_colors if c not in ['#000', '#000000', '#fff', '#ffffff', 'transparent']]
+    # Filter out black and white (colors are already normalized)
+    filtered_colors = colors - BLACKLIST
     
-    # If we have too few colors, look for commonly used CSS color names
+    # If we have too few colors, look for commonly used CSS color variables
     if len(filtered_colors) < 2:
-        common_color_names = ['primary', 'secondary', 'accent', 'main', 'brand']
-        for name in common_color_names:
-            color_props = re.findall(fr'--{name}(?:-color)?\s*:\s*([^;]+)', html_content)
-            for prop in color_props:
-                hex_match = re.search(r'#(?:[0-9a-fA-F]{3}){1,2}', prop)
-                if hex_match:
-                    filtered_colors.append(hex_match.group(0).lower())
+        for match in CSS_COLOR_VAR_RE.finditer(html_content):
+            prop_colors = find_colors(match.group(1))
+            if prop_colors:
+                filtered_colors.add(prop_colors[0])
     
-    # Sort colors by perceptual distinctiveness
-    if len(filtered_colors) > 1:
-        sorted_colors = sort_colors_by_distinctiveness(filtered_colors)
-        return sorted_colors[:max_colors]
+    # Only rank by perceptual distinctiveness when there are more colors than we can show
+    if len(filtered_colors) <= max_colors:
+        return sorted(filtered_colors)
     
-    return filtered_colors[:max_colors]
+    return sort_colors_by_distinctiveness(list(filtered_colors), max_colors)
 
-def sort_colors_by_distinctiveness(colors):
+def sort_colors_by_distinctiveness(colors, max_colors=None):
     """
     Sort colors by perceptual distinctiveness to get a good palette
     
     Args:
-        colors (list): List of hex color codes
+        colors (list): List of #rrggbb color codes, as returned by find_colors
+        max_colors (int): Only return this many colors, None for all of them
         
     Returns:
         list: Sorted list of hex color codes
     """
-    # Convert hex to HSV for better perceptual sorting
-    hsv_colors = []
-    for color in colors:
-        # Normalize the hex color
-        if len(color) == 4:  # Convert #rgb to #rrggbb
-            r = int(color[1] + color[1], 16) / 255.0
-            g = int(color[2] + color[2], 16) / 255.0
-            b = int(color[3] + color[3], 16) / 255.0
-        else:
-            r = int(color[1:3], 16) / 255.0
-            g = int(color[3:5], 16) / 255.0
-            b = int(color[5:7], 16) / 255.0
-        
-        h, s, v = colorsys.rgb_to_hsv(r, g, b)
-        hsv_colors.append((color, h, s, v))
+    if not colors:
+        return []
     
-    # Sort by hue primarily
-    hsv_colors.sort(key=lambda x: x[1])
+    # Convert all colors to an (n, 3) array of RGB values in [0, 1]
+    rgb = np.frombuffer(bytes.fromhex(''.join(c[1:] for c in colors)), dtype=np.uint8)
+    rgb = rgb.reshape(-1, 3) / 255.0
+    r, g, b = rgb.T
     
-    # Pick colors with good spacing
-    result = []
-    if hsv_colors:
-        result.append(hsv_colors[0][0])
-        
-        # If we have more than one color, try to maximize distinctiveness
-        if len(hsv_colors) > 1:
-            # Sort remaining colors by saturation (more saturated colors are more distinctive)
-            remaining = sorted(hsv_colors[1:], key=lambda x: x[2], reverse=True)
-            for color_info in remaining:
-                result.append(color_info[0])
+    # Vectorized RGB -> HSV (same formula as colorsys.rgb_to_hsv)
+    cmax = rgb.max(axis=1)
+    cmin = rgb.min(axis=1)
+    delta = cmax - cmin
+    safe_delta = np.where(delta == 0, 1, delta)
+    hue = np.where(cmax == r, (g - b) / safe_delta,
+                   np.where(cmax == g, 2.0 + (b - r) / safe_delta, 4.0 + (r - g) / safe_delta))
+    hue = np.where(delta == 0, 0.0, (hue / 6.0) % 1.0)
+    saturation = np.where(cmax == 0, 0.0, delta / np.where(cmax == 0, 1, cmax))
+    
+    # Start with the color of the lowest hue
+    first = np.argmin(hue)
+    rest = np.delete(np.arange(len(colors)), first)
+    
+    # With a limit, only the most saturated colors can make it, so partition
+    # them out first and keep everything tied with the last one for the sort
+    if max_colors is not None and max_colors - 1 < len(rest):
+        if max_colors < 2:
+            return [colors[first]][:max_colors]
+        threshold = -np.partition(-saturation[rest], max_colors - 2)[max_colors - 2]
+        rest = rest[saturation[rest] >= threshold]
+    
+    # Sort remaining colors by saturation (more saturated colors are more distinctive), then by hue
+    remaining = rest[np.lexsort((rest, hue[rest], -saturation[rest]))]
     
-    return result
+    return [colors[i] for i in (first, *remaining)][:max_colors]
 
 def extract_logo(soup, base_url):
     """
@@ -151,141 +232,119 @@ def extract_logo(soup, base_url):
     Returns:
         str: URL of the logo image
     """
-    # Common logo selectors
-    logo_selectors = [
-        {'tag': 'img', 'attrs': {'class': re.compile(r'logo', re.I)}},
-        {'tag': 'img', 'attrs': {'id': re.compile(r'logo', re.I)}},
-        {'tag': 'img', 'attrs': {'alt': re.compile(r'logo', re.I)}},
-        {'tag': 'img', 'attrs': {'src': re.compile(r'logo', re.I)}},
-        {'tag': 'a', 'attrs': {'class': re.compile(r'logo', re.I)}, 'find_child': 'img'},
-        {'tag': 'div', 'attrs': {'class': re.compile(r'logo', re.I)}, 'find_child': 'img'},
-        {'tag': 'svg', 'attrs': {'class': re.compile(r'logo', re.I)}},
-    ]
+    # Logo candidates by priority (lower wins), filled in a single pass over the document:
+    # 0-3: img whose class/id/alt/src mentions "logo"
+    # 4-5: img inside an a/div whose class mentions "logo"
+    # 6: svg whose class mentions "logo"
+    # 7: first img inside the first header element
+    # 8: img inside a link to the home page
+    candidates = {}
+    header_checked = False
     
-    # Try each selector
-    for selector in logo_selectors:
-        elements = soup.find_all(selector['tag'], selector['attrs'])
-        for element in elements:
-            # If we need to find a child element
-            if 'find_child' in selector:
-                child = element.find(selector['find_child'])
-                if child and 'src' in child.attrs:
-                    logo_url = urljoin(base_url, child['src'])
-                    return logo_url
-            # If the element is an image
-            elif element.name == 'img' and 'src' in element.attrs:
-                logo_url = urljoin(base_url, element['src'])
-                return logo_url
-            # If the element is an SVG
-            elif element.name == 'svg':
-                # Return SVG as data URI
-                svg_str = str(element)
-                svg_base64 = base64.b64encode(svg_str.encode('utf-8')).decode('utf-8')
-                return f"data:image/svg+xml;base64,{svg_base64}"
+    for element in soup.find_all(True):
+        name = element.name
+        class_names = ' '.join(element.get('class', []))
+        
+        if name == 'img':
+            if 'src' not in element.attrs:
+                continue
+            for priority, attr in enumerate(('class', 'id', 'alt', 'src')):
+                value = class_names if attr == 'class' else element.get(attr)
+                if value and LOGO_RE.search(value):
+                    logo_url = urljoin(base_url, element['src'])
+                    # Nothing can beat the top priority, stop scanning
+                    if priority == 0:
+                        return logo_url
+                    candidates.setdefault(priority, logo_url)
+                    break
+            continue
+        
+        if name in ('a', 'div') and 4 not in candidates and LOGO_RE.search(class_names):
+            child = element.find('img')
+            if child and 'src' in child.attrs:
+                candidates.setdefault(4 if name == 'a' else 5, urljoin(base_url, child['src']))
+        elif name == 'svg' and LOGO_RE.search(class_names):
+            candidates.setdefault(6, element)
+        
+        # Check the header area specifically
+        if name in ('header', 'div') and not header_checked and HEADER_RE.search(class_names):
+            header_checked = True
+            logo_img = element.find('img')
+            if logo_img and 'src' in logo_img.attrs:
+                candidates[7] = urljoin(base_url, logo_img['src'])
+        
+        # Check for link to home with image inside
+        if name == 'a' and element.get('href') == '/' and 8 not in candidates:
+            img = element.find('img')
+            if img and 'src' in img.attrs:
+                candidates[8] = urljoin(base_url, img['src'])
     
-    # Check the header area specifically
-    header = soup.find(['header', 'div'], {'class': re.compile(r'header', re.I)})
-    if header:
-        logo_img = header.find('img')
-        if logo_img and 'src' in logo_img.attrs:
-            logo_url = urljoin(base_url, logo_img['src'])
-            return logo_url
+    if not candidates:
+        return None
     
-    # Check for link to home with image inside
-    home_links = soup.find_all('a', {'href': ['/']})
-    for link in home_links:
-        img = link.find('img')
-        if img and 'src' in img.attrs:
-            logo_url = urljoin(base_url, img['src'])
-            return logo_url
+    logo = candidates[min(candidates)]
+    if isinstance(logo, str):
+        return logo
     
-    return None
+    # Return SVG as data URI
+    import base64
+    svg_base64 = base64.b64encode(str(logo).encode('utf-8')).decode('utf-8')
+    return f"data:image/svg+xml;base64,{svg_base64}"
 
-def identify_fonts(soup, html_content):
+def identify_fonts(soup, style_text=None, inline_styles=None):
     """
     Identify fonts used on a website
     
     Args:
         soup (BeautifulSoup): Parsed HTML
-        html_content (str): Raw HTML content
+        style_text (str): Contents of the style tags, see get_style_text
+        inline_styles (str): Inline style attributes, see get_inline_styles
         
     Returns:
-        list: List of font family names
+        list: List of font family names, in the order they were found
     """
-    fonts = []
+    # Used as an ordered set
+    fonts = {}
     
     # Extract fonts from CSS
     try:
         # Look for Google Fonts
-        google_fonts_links = soup.find_all('link', href=re.compile(r'fonts\.googleapis\.com'))
-        for link in google_fonts_links:
-            href = link.get('href', '')
+        for link in soup.find_all('link', href=True):
+            href = link['href']
             # Extract font names from Google Fonts URL
-            if 'family=' in href:
+            if 'fonts.googleapis.com' in href and 'family=' in href:
                 family_part = href.split('family=')[1].split('&')[0]
                 font_families = family_part.split('|')
                 for family in font_families:
                     # Remove weight/style specifications
-                    clean_family = re.sub(r':[^,]+', '', family)
+                    clean_family = GOOGLE_FONT_SPEC_RE.sub('', family)
                     # Replace '+' with spaces
-                    clean_family = clean_family.replace('+', ' ')
-                    fonts.append(clean_family)
-        
-        # Check for @font-face rules
-        font_face_matches = re.findall(r'@font-face\s*{[^}]+font-family\s*:\s*[\'"]([^\'"]+)[\'"]', html_content)
-        fonts.extend(font_face_matches)
-        
-        # Check for font-family properties in style tags
-        for style_tag in soup.find_all('style'):
-            if style_tag.string:
-                font_family_matches = re.findall(r'font-family\s*:\s*([^;}]+)', style_tag.string)
-                for match in font_family_matches:
-                    # Extract individual font families
-                    for family in match.split(','):
-                        family = family.strip()
-                        # Remove quotes
-                        family = re.sub(r'^[\'"]|[\'"]$', '', family)
-                        if family and family.lower() not in ['sans-serif', 'serif', 'monospace']:
-                            fonts.append(family)
+                    clean_family = clean_family.replace('+', ' ').strip()
+                    if clean_family.casefold() not in GENERIC_FAMILIES:
+                        fonts[clean_family] = None
         
-        # Check inline styles
-        elements_with_style = soup.find_all(style=True)
-        for element in elements_with_style:
-            style_content = element['style']
-            if 'font-family' in style_content:
-                font_family_matches = re.findall(r'font-family\s*:\s*([^;}]+)', style_content)
-                for match in font_family_matches:
-                    # Extract individual font families
-                    for family in match.split(','):
-                        family = family.strip()
-                        # Remove quotes
-                        family = re.sub(r'^[\'"]|[\'"]$', '', family)
-                        if family and family.lower() not in ['sans-serif', 'serif', 'monospace']:
-                            fonts.append(family)
-                            
-        # Check for CSS variables related to fonts
-        font_vars = re.findall(r'--(?:font|typography)-family(?:-[a-z]+)?\s*:\s*([^;}]+)', html_content)
-        for var in font_vars:
-            # Extract individual font families
-            for family in var.split(','):
-                family = family.strip()
-                # Remove quotes
-                family = re.sub(r'^[\'"]|[\'"]$', '', family)
-                if family and family.lower() not in ['sans-serif', 'serif', 'monospace']:
-                    fonts.append(family)
+        # Check @font-face rules, font CSS variables and font-family properties
+        # in style tags and inline styles
+        if style_text is None:
+            style_text = get_style_text(soup)
+        if inline_styles is None:
+            inline_styles = get_inline_styles(soup)
+        for text in (style_text, inline_styles):
+            for match in FONT_ALL_RE.finditer(text):
+                if match.lastgroup == 'face':
+                    family = match.group('face').strip()
+                    if family.casefold() not in GENERIC_FAMILIES:
+                        fonts[family] = None
+                    continue
+                # Extract individual font families
+                for family in match.group(match.lastgroup).split(','):
+                    # Remove whitespace and quotes
+                    family = family.strip().strip('\'"')
+                    # Skip generic family names and empty strings
+                    if family.casefold() not in GENERIC_FAMILIES:
+                        fonts[family] = None
                     
     except Exception as e:
         logging.warning(f"Error identifying fonts: {str(e)}")
     
-    # Normalize and deduplicate
-    normalized_fonts = []
-    for font in fonts:
-        font = font.strip()
-        # Skip generic family names and empty strings
-        if font and font.lower() not in ['sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', '']:
-            normalized_fonts.append(font)
-    
-    # Remove duplicates and sort
-    unique_fonts = sorted(list(set(normalized_fonts)))
-    
-    return unique_fonts
+    return list(fonts)
@@ -1,25 +1,115 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httpx
+from bs4 import BeautifulSoup, Tag
 import re
 import logging
 from urllib.parse import urljoin, urlparse
-from .design_elements import extract_colors, extract_logo, identify_fonts
-from .utils import is_valid_email, is_valid_phone
+from .async_scraper import RETRY_STATUS_CODES, AsyncScraper
+from .design_elements import extract_color_palette, extract_logo, identify_fonts, get_style_text, get_inline_styles, get_stylesheet_urls
+from .utils import HEADERS, is_valid_email, is_valid_phone, normalize_field_name
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def scrape_website(url, profile, extract_colors=True, extract_logo=True, extract_fonts=True):
+# Prefer the C-based lxml parser, fall back to the pure-Python one when it isn't installed
+try:
+    import lxml
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+
+# Shared session so repeated requests to a host reuse its pooled keep-alive connections.
+# requests already advertises every compression scheme it can decode (gzip, deflate and
+# br when brotli is installed), so Accept-Encoding is left at its default
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=RETRY_STATUS_CODES, allowed_methods=['GET'])
+))
+SESSION.mount('http://', SESSION.get_adapter('https://'))
+
+# Linked stylesheets are fetched through SESSION as well, a few at a time
+STYLESHEET_WORKERS = 8
+STYLESHEET_TIMEOUT = 10
+
+# Recently parsed pages by URL, so repeated scrapes (other profiles, retries, refreshes) skip
+# the fetch, the parse and the design element extraction. Parsed trees are large, so only a few
+# are kept; after PAGE_CACHE_TTL seconds a page is revalidated with its ETag/Last-Modified and
+# reused as is on 304 Not Modified
+PAGE_CACHE = OrderedDict()
+PAGE_CACHE_SIZE = 32
+PAGE_CACHE_TTL = 300
+PAGE_CACHE_LOCK = threading.Lock()
+
+# Precompiled patterns
+BRAND_LOGO_RE = re.compile(r'logo|brand', re.I)
+HOURS_RE = re.compile(r'hours|time|schedule', re.I)
+TIME_RE = re.compile(r'\d{1,2}[:.]\d{2}')
+ADDRESS_RE = re.compile(r'address|location', re.I)
+META_ADDRESS_RE = re.compile(r'og:address|place:location:address')
+TEAM_RE = re.compile(r'team|staff|personnel|people|about', re.I)
+PERSON_RE = re.compile(r'card|member|person|profile', re.I)
+ROLE_RE = re.compile(r'role|position|title', re.I)
+MAILTO_RE = re.compile(r'^mailto:')
+TEL_RE = re.compile(r'^tel:')
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.[a-z]{2,}')
+SERVICES_HEADER_RE = re.compile(r'שירותים|תחומי|התמחויות|פעילות', re.I)
+
+# Common city names in Israel and Hebrew day names, each matched in a single regex pass
+CITIES = ["תל אביב", "ירושלים", "חיפה", "באר שבע", "רמת גן", "הרצליה", "נתניה", "פתח תקווה", "אשדוד", "אילת"]
+CITIES_RE = re.compile('|'.join(map(re.escape, CITIES)))
+DAYS = ["ראשון", "שני", "שלישי", "רביעי", "חמישי", "שישי", "שבת"]
+DAYS_RE = re.compile('|'.join(map(re.escape, DAYS)))
+
+# Elements collected by collect_nodes, by class or id
+NODE_PATTERNS = {
+    'address': ADDRESS_RE,
+    'hours': HOURS_RE,
+    'team': TEAM_RE
+}
+# Tags that hold a team member's name
+NAME_TAGS = frozenset(('h3', 'h4', 'h5', 'strong', 'b'))
+# Elements whose text may hold a free-form address
+TEXT_BLOCK_TAGS = frozenset(('p', 'div', 'span', 'address'))
+
+# Common patterns for phone numbers
+PHONE_PATTERNS = [
+    re.compile(r'(?:\+972[- ]?|0)[2-9]{1}[- ]?\d{7}'),  # Israeli format
+    re.compile(r'\+\d{1,3}[- ]?\d{1,4}[- ]?\d{4,}'),    # International format
+    re.compile(r'\(\d{3,4}\)\s*\d{3}[- ]?\d{4}'),       # (XXX) XXX-XXXX format
+    re.compile(r'\d{3}[- ]?\d{3}[- ]?\d{4}')            # XXX-XXX-XXXX format
+]
+
+SOCIAL_PATTERNS = {
+    'facebook': re.compile(r'facebook\.com'),
+    'twitter': re.compile(r'twitter\.com|x\.com'),
+    'instagram': re.compile(r'instagram\.com'),
+    'linkedin': re.compile(r'linkedin\.com'),
+    'youtube': re.compile(r'youtube\.com'),
+    'tiktok': re.compile(r'tiktok\.com'),
+    'whatsapp': re.compile(r'wa\.me|whatsapp\.com')
+}
+
+def scrape_website(url, profile, do_extract_colors=True, do_extract_logo=True, do_extract_fonts=True):
     """
     Main scraping function that extracts data based on the selected profile
     
     Args:
         url (str): Website URL to scrape
         profile (dict): Selected profile configuration
-        extract_colors (bool): Whether to extract color palette
-        extract_logo (bool): Whether to extract logo
-        extract_fonts (bool): Whether to identify fonts
+        do_extract_colors (bool): Whether to extract color palette
+        do_extract_logo (bool): Whether to extract logo
+        do_extract_fonts (bool): Whether to identify fonts
         
     Returns:
         tuple: (extracted_data, design_elements)
@@ -27,37 +117,40 @@ def scrape_website(url, profile, extract_colors=True, extract_logo=True, extract
     logger.info(f"Starting scraping for URL: {url}")
     
     try:
-        # Make request
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        }
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        # Parse HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Fetch and parse the page, or reuse a recent parse of it
+        entry, headers = lookup_page(url)
+        if entry is None or headers:
+            response = SESSION.get(url, headers=headers, timeout=30)
+            response.raise_for_status()
+            entry = store_page(url, entry, response.status_code, response.headers, response.content, response.text)
+        html_content, soup = entry['html_content'], entry['soup']
         
         # Extract data based on profile
-        extracted_data = {}
-        for field in profile["fields"]:
-            value = extract_field(soup, field, url)
-            extracted_data[field] = value
-            
-        # Extract design elements
-        design_elements = {}
+        extracted_data = extract_profile_fields(soup, profile, url)
         
-        if extract_colors:
-            design_elements['colors'] = extract_color_palette(soup, response.text)
-            
-        if extract_logo:
-            design_elements['logo_url'] = extract_logo(soup, url)
+        # Extract design elements, once per parsed page and set of options
+        design_key = (do_extract_colors, do_extract_logo, do_extract_fonts)
+        design_elements = entry['design_elements'].get(design_key)
+        if design_elements is None:
+            # Fetch linked stylesheets for the color and font extractors
+            stylesheet_urls, stylesheet_texts = [], []
+            if do_extract_colors or do_extract_fonts:
+                stylesheet_urls = get_stylesheet_urls(soup, url)
+                if stylesheet_urls:
+                    stylesheet_texts = fetch_stylesheets(stylesheet_urls)
             
-        if extract_fonts:
-            design_elements['fonts'] = identify_fonts(soup, response.text)
+            design_elements = extract_design_elements(
+                soup, html_content, url, stylesheet_texts, do_extract_colors, do_extract_logo, do_extract_fonts
+            )
+            # Failed stylesheets are skipped, so only keep results built from all of them
+            if len(stylesheet_texts) == len(stylesheet_urls):
+                entry['design_elements'][design_key] = design_elements
         
-        return extracted_data, design_elements
+        # Copy the lists too, so callers can't change the memoized results
+        return extracted_data, {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in design_elements.items()
+        }
         
     except requests.RequestException as e:
         logger.error(f"Request error: {str(e)}")
@@ -66,275 +159,608 @@ def scrape_website(url, profile, extract_colors=True, extract_logo=True, extract
         logger.error(f"Scraping error: {str(e)}")
         raise Exception(f"Error during scraping: {str(e)}")
 
-def extract_field(soup, field_name, base_url):
+def fetch_stylesheets(urls):
     """
-    Extract a specific field from the webpage
+    Fetch linked stylesheets through the shared session, a few at a time
     
     Args:
-        soup (BeautifulSoup): Parsed HTML
-        field_name (str): Name of the field to extract
-        base_url (str): Base URL for resolving relative links
+        urls (list): Stylesheet URLs
+    
+    Returns:
+        list: Stylesheet contents, failed URLs are logged and skipped
+    """
+    def fetch(url):
+        try:
+            response = SESSION.get(url, timeout=STYLESHEET_TIMEOUT)
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException as e:
+            logger.warning(f"Could not fetch {url}: {str(e)}")
+            return None
+    
+    with ThreadPoolExecutor(max_workers=min(STYLESHEET_WORKERS, len(urls))) as executor:
+        return [text for text in executor.map(fetch, urls) if text is not None]
+
+async def scrape_website_async(url, profile, fetcher, do_extract_colors=True, do_extract_logo=True, do_extract_fonts=True):
+    """
+    Async version of scrape_website that fetches through a shared client
+    
+    Args:
+        url (str): Website URL to scrape
+        profile (dict): Selected profile configuration
+        fetcher (AsyncScraper): Open client used for the page and its stylesheets
+        do_extract_colors (bool): Whether to extract color palette
+        do_extract_logo (bool): Whether to extract logo
+        do_extract_fonts (bool): Whether to identify fonts
         
     Returns:
-        str or list: Extracted data
+        tuple: (extracted_data, design_elements)
     """
-    # Business name extraction
-    if field_name == "שם העסק":
-        # Check title tag
-        title = soup.title.text.strip() if soup.title else ""
+    logger.info(f"Starting scraping for URL: {url}")
+    
+    try:
+        # Parsing and extraction are CPU-bound, so they run in worker threads to keep
+        # the event loop free for the other pages' downloads
         
-        # Check for h1 tags
-        h1_tags = soup.find_all('h1')
-        if h1_tags:
-            for h1 in h1_tags:
-                if len(h1.text.strip()) > 3 and len(h1.text.strip()) < 50:
-                    return h1.text.strip()
+        # Fetch and parse the page, or reuse a recent parse of it
+        entry, headers = lookup_page(url)
+        if entry is None or headers:
+            response = await fetcher.fetch(url, headers=headers)
+            entry = await asyncio.to_thread(
+                store_page, url, entry, response.status_code, response.headers, response.content, response.text
+            )
+        html_content, soup = entry['html_content'], entry['soup']
         
-        # Check for logo alt text
-        logo = soup.find('img', {'class': re.compile(r'logo|brand', re.I)})
-        if logo and logo.get('alt'):
-            return logo.get('alt')
-            
-        # Return title as fallback
-        return title
-    
-    # Phone number extraction
-    elif field_name == "טלפון":
-        # Common patterns for phone numbers
-        phone_patterns = [
-            r'(?:\+972[- ]?|0)[2-9]{1}[- ]?\d{7}',  # Israeli format
-            r'\+\d{1,3}[- ]?\d{1,4}[- ]?\d{4,}',    # International format
-            r'\(\d{3,4}\)\s*\d{3}[- ]?\d{4}',       # (XXX) XXX-XXXX format
-            r'\d{3}[- ]?\d{3}[- ]?\d{4}'            # XXX-XXX-XXXX format
-        ]
+        # Design elements are extracted once per parsed page and set of options
+        design_key = (do_extract_colors, do_extract_logo, do_extract_fonts)
+        design_elements = entry['design_elements'].get(design_key)
         
-        # Look for phone pattern in text
-        text = soup.get_text()
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                # Filter out invalid matches
-                valid_phones = [p for p in matches if is_valid_phone(p)]
-                if valid_phones:
-                    return valid_phones[0]
-                    
-        # Look for elements with tel: links
-        tel_links = soup.find_all('a', href=re.compile(r'^tel:'))
-        if tel_links:
-            for link in tel_links:
-                phone = link['href'].replace('tel:', '')
-                if is_valid_phone(phone):
-                    return phone
-                    
-        return ""
+        # Extract data based on profile while the linked stylesheets are fetched
+        stylesheet_urls = []
+        if design_elements is None and (do_extract_colors or do_extract_fonts):
+            stylesheet_urls = get_stylesheet_urls(soup, url)
+        extracted_data, stylesheet_texts = await asyncio.gather(
+            asyncio.to_thread(extract_profile_fields, soup, profile, url),
+            fetcher.fetch_all(stylesheet_urls)
+        )
+        
+        # Extract design elements
+        if design_elements is None:
+            design_elements = await asyncio.to_thread(
+                extract_design_elements,
+                soup, html_content, url, stylesheet_texts, do_extract_colors, do_extract_logo, do_extract_fonts
+            )
+            # Failed stylesheets are skipped, so only keep results built from all of them
+            if len(stylesheet_texts) == len(stylesheet_urls):
+                entry['design_elements'][design_key] = design_elements
+        
+        # Copy the lists too, so callers can't change the memoized results
+        return extracted_data, {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in design_elements.items()
+        }
+        
+    except httpx.HTTPError as e:
+        logger.error(f"Request error: {str(e)}")
+        raise Exception(f"Failed to fetch website: {str(e)}")
+    except Exception as e:
+        logger.error(f"Scraping error: {str(e)}")
+        raise Exception(f"Error during scraping: {str(e)}")
+
+async def scrape_many(urls, profile, do_extract_colors=True, do_extract_logo=True, do_extract_fonts=True, max_concurrent=10):
+    """
+    Scrape several websites concurrently over one connection pool
     
-    # Email extraction
-    elif field_name == "דוא\"ל" or field_name == "דוא'ל" or field_name == "דוא״ל":
-        # Look for mailto links
-        mailto_links = soup.find_all('a', href=re.compile(r'^mailto:'))
-        if mailto_links:
-            for link in mailto_links:
-                email = link['href'].replace('mailto:', '').split('?')[0]
-                if is_valid_email(email):
-                    return email
+    Args:
+        urls (list): Website URLs to scrape
+        profile (dict): Selected profile configuration
+        do_extract_colors (bool): Whether to extract color palette
+        do_extract_logo (bool): Whether to extract logo
+        do_extract_fonts (bool): Whether to identify fonts
+        max_concurrent (int): Maximum number of requests in flight
         
-        # Look for email patterns in text
-        text = soup.get_text()
-        emails = re.findall(r'[\w\.-]+@[\w\.-]+\.[a-z]{2,}', text)
+    Returns:
+        list: (extracted_data, design_elements) per URL, or the exception raised for it
+    """
+    async with AsyncScraper(max_concurrent=max_concurrent, timeout=30) as fetcher:
+        return await asyncio.gather(
+            *(scrape_website_async(url, profile, fetcher, do_extract_colors, do_extract_logo, do_extract_fonts) for url in urls),
+            return_exceptions=True
+        )
+
+def scrape_websites(urls, profile, **kwargs):
+    """
+    Synchronous wrapper around scrape_many
+    
+    Runs its own event loop, so it must not be called from a running one.
+    
+    Args:
+        urls (list): Website URLs to scrape
+        profile (dict): Selected profile configuration
+        **kwargs: Options passed to scrape_many
         
-        valid_emails = [e for e in emails if is_valid_email(e)]
-        if valid_emails:
-            return valid_emails[0]
-            
-        return ""
+    Returns:
+        list: (extracted_data, design_elements) per URL, or the exception raised for it
+    """
+    return asyncio.run(scrape_many(urls, profile, **kwargs))
+
+def lookup_page(url):
+    """
+    Look a page up in PAGE_CACHE
     
-    # Address extraction
-    elif field_name == "כתובת":
-        # Look for address in meta tags
-        meta_address = soup.find('meta', {'property': re.compile(r'og:address|place:location:address')})
-        if meta_address and meta_address.get('content'):
-            return meta_address.get('content')
+    Args:
+        url (str): Page URL
         
-        # Look for address in schema.org markup
-        address_elem = soup.find('span', {'itemprop': 'address'})
-        if address_elem:
-            return address_elem.text.strip()
-            
-        # Look for common address patterns in Israel (city names followed by street)
-        cities = ["תל אביב", "ירושלים", "חיפה", "באר שבע", "רמת גן", "הרצליה", "נתניה", "פתח תקווה", "אשדוד", "אילת"]
+    Returns:
+        tuple: (cache entry or None, headers for the request). No headers with an
+        entry means it is fresh and can be used without a request; otherwise the
+        headers make the request conditional on the cached copy being stale
+    """
+    with PAGE_CACHE_LOCK:
+        entry = PAGE_CACHE.get(url)
+        if entry is not None:
+            PAGE_CACHE.move_to_end(url)
+    
+    if entry is None or time.monotonic() - entry['fetched_at'] < PAGE_CACHE_TTL:
+        return entry, None
+    
+    headers = {}
+    if entry['etag']:
+        headers['If-None-Match'] = entry['etag']
+    if entry['last_modified']:
+        headers['If-Modified-Since'] = entry['last_modified']
+    # Without validators the stale copy can't be revalidated, so fetch it again
+    return (entry if headers else None), headers
+
+def store_page(url, entry, status_code, headers, content, text):
+    """
+    Parse a fetched page and store it in PAGE_CACHE
+    
+    Args:
+        url (str): Page URL
+        entry (dict): Cached entry the request was conditional on, if any
+        status_code (int): Response status code
+        headers (Mapping): Response headers
+        content (bytes): Response body
+        text (str): Decoded response body
+        
+    Returns:
+        dict: Cache entry with the html_content and soup of the page
+    """
+    if entry is not None and status_code == 304:
+        # Not modified, keep using the cached parse. Linked stylesheets may have changed even
+        # though the page did not, so design elements are extracted again
+        entry['fetched_at'] = time.monotonic()
+        entry['design_elements'] = {}
+        return entry
+    
+    entry = {
+        'fetched_at': time.monotonic(),
+        'etag': headers.get('ETag'),
+        'last_modified': headers.get('Last-Modified'),
+        'html_content': text,
+        # Parse from bytes, so the parser picks the encoding up from <meta charset>
+        'soup': BeautifulSoup(content, PARSER),
+        # Design elements already extracted from this page, by scrape options
+        'design_elements': {},
+    }
+    with PAGE_CACHE_LOCK:
+        PAGE_CACHE[url] = entry
+        PAGE_CACHE.move_to_end(url)
+        while len(PAGE_CACHE) > PAGE_CACHE_SIZE:
+            PAGE_CACHE.popitem(last=False)
+    return entry
+
+def extract_profile_fields(soup, profile, base_url):
+    """
+    Extract every field of a profile from the webpage
+    
+    Args:
+        soup (BeautifulSoup): Parsed HTML
+        profile (dict): Selected profile configuration
+        base_url (str): Base URL for resolving relative links
+        
+    Returns:
+        dict: Extracted value per field name
+    """
+    # Page text, links and candidate elements are shared by several fields, so collect them once,
+    # and only when one of the profile's fields actually reads them
+    extractors = {FIELD_EXTRACTORS.get(normalize_field_name(field)) for field in profile["fields"]}
+    page_text = soup.get_text(' ', strip=True) if extractors & TEXT_EXTRACTORS else None
+    links = soup.find_all('a', href=True) if extractors & LINK_EXTRACTORS else None
+    nodes = collect_nodes(soup) if extractors & NODE_EXTRACTORS else None
+    
+    extracted_data = {}
+    for field in profile["fields"]:
+        value = extract_field(soup, field, base_url, page_text, links, nodes)
+        extracted_data[field] = value
+    return extracted_data
+
+def extract_design_elements(soup, html_content, base_url, stylesheet_texts, do_extract_colors=True, do_extract_logo=True, do_extract_fonts=True):
+    """
+    Extract the design elements of the webpage
+    
+    Args:
+        soup (BeautifulSoup): Parsed HTML
+        html_content (str): Raw HTML content
+        base_url (str): Base URL for resolving relative links
+        stylesheet_texts (list): Contents of the linked stylesheets
+        do_extract_colors (bool): Whether to extract color palette
+        do_extract_logo (bool): Whether to extract logo
+        do_extract_fonts (bool): Whether to identify fonts
         
-        for elem in soup.find_all(['p', 'div', 'span', 'address']):
-            text = elem.text.strip()
-            # Check if text contains a city name and looks like an address
-            if any(city in text for city in cities) and len(text) < 100 and len(text) > 10:
-                return text
+    Returns:
+        dict: Design elements (colors, logo_url, fonts)
+    """
+    design_elements = {}
+    
+    # Collect style tags, linked stylesheets and inline styles once for the color and font extractors
+    if do_extract_colors or do_extract_fonts:
+        style_text = "\n".join([get_style_text(soup), *stylesheet_texts])
+        inline_styles = get_inline_styles(soup)
+    
+    if do_extract_colors:
+        design_elements['colors'] = extract_color_palette(
+            soup, html_content, style_text=style_text, inline_styles=inline_styles
+        )
         
-        # Look for elements with address in class or id
-        address_elems = soup.find_all(class_=re.compile(r'address|location', re.I))
-        address_elems += soup.find_all(id=re.compile(r'address|location', re.I))
+    if do_extract_logo:
+        design_elements['logo_url'] = extract_logo(soup, base_url)
         
-        if address_elems:
-            for elem in address_elems:
-                if len(elem.text.strip()) > 5 and len(elem.text.strip()) < 150:
-                    return elem.text.strip()
-                    
-        return ""
+    if do_extract_fonts:
+        design_elements['fonts'] = identify_fonts(soup, style_text=style_text, inline_styles=inline_styles)
     
-    # Opening hours extraction
-    elif field_name == "שעות פעילות" or field_name == "שעות פתיחה" or field_name == "שעות קבלה":
-        # Look for common patterns for hours
-        hours_elems = soup.find_all(class_=re.compile(r'hours|time|schedule', re.I))
-        hours_elems += soup.find_all(id=re.compile(r'hours|time|schedule', re.I))
+    return design_elements
+
+def collect_nodes(soup):
+    """
+    Walk the DOM once and sort the elements the field extractors look at into buckets
+    
+    Args:
+        soup (BeautifulSoup): Parsed HTML
         
-        # Common day names in Hebrew
-        days = ["ראשון", "שני", "שלישי", "רביעי", "חמישי", "שישי", "שבת"]
+    Returns:
+        dict: Elements per bucket, one per NODE_PATTERNS key plus text_blocks
+    """
+    class_matches = {name: [] for name in NODE_PATTERNS}
+    id_matches = {name: [] for name in NODE_PATTERNS}
+    text_blocks = []
+    
+    # Iterate the tree directly; find_all(True) would run its matcher on every element
+    for element in soup.descendants:
+        if not isinstance(element, Tag):
+            continue
+        if element.name in TEXT_BLOCK_TAGS:
+            text_blocks.append(element)
         
-        # Check elements with hours-related classes/ids
-        for elem in hours_elems:
-            text = elem.text.strip()
-            # Check if the text contains day names and time patterns
-            if any(day in text for day in days) and re.search(r'\d{1,2}[:.]\d{2}', text):
-                # Clean up and format the hours
-                lines = [line.strip() for line in text.split('\n') if line.strip()]
-                return "\n".join(lines)
-                
-        # Look for table with days and hours
-        for table in soup.find_all('table'):
-            rows = table.find_all('tr')
-            if 3 <= len(rows) <= 8:  # Typical number of rows for hours table
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    if cells and any(day in cells[0].text for day in days):
-                        hours = []
-                        for row in rows:
-                            row_text = " ".join([cell.text.strip() for cell in row.find_all(['td', 'th'])])
-                            if row_text:
-                                hours.append(row_text)
-                        return "\n".join(hours)
-                        
+        classes = element.get('class')
+        element_id = element.get('id')
+        if not classes and not element_id:
+            continue
+        
+        class_text = ' '.join(classes) if classes else ''
+        for name, pattern in NODE_PATTERNS.items():
+            if class_text and pattern.search(class_text):
+                class_matches[name].append(element)
+            if element_id and pattern.search(element_id):
+                id_matches[name].append(element)
+    
+    # Like find_all(class_=...) + find_all(id=...): class matches first, then id matches
+    nodes = {name: class_matches[name] + id_matches[name] for name in NODE_PATTERNS}
+    nodes['text_blocks'] = text_blocks
+    return nodes
+
+def extract_field(soup, field_name, base_url, page_text=None, links=None, nodes=None):
+    """
+    Extract a specific field from the webpage
+    
+    Args:
+        soup (BeautifulSoup): Parsed HTML
+        field_name (str): Name of the field to extract
+        base_url (str): Base URL for resolving relative links
+        page_text (str): Text of the whole page, computed from soup if not given
+        links (list): All a tags with an href, computed from soup if not given
+        nodes (dict): Candidate elements from collect_nodes, computed from soup if not given
+        
+    Returns:
+        str or list: Extracted data
+    """
+    extractor = FIELD_EXTRACTORS.get(normalize_field_name(field_name))
+    if extractor is None:
+        # Default fallback: return empty result
         return ""
+    return extractor(soup, base_url, page_text, links, nodes)
+
+def _extract_business_name(soup, base_url, page_text, links, nodes):
+    """Extract the business name from the first short h1, the logo alt text or the title"""
+    # Check for h1 tags
+    for h1 in soup.find_all('h1'):
+        text = h1.text.strip()
+        if 3 < len(text) < 50:
+            return text
     
-    # Team/Staff extraction
-    elif field_name == "צוות" or field_name == "רופאים":
-        team = []
-        # Look for team sections
-        team_sections = soup.find_all(class_=re.compile(r'team|staff|personnel|people|about', re.I))
-        team_sections += soup.find_all(id=re.compile(r'team|staff|personnel|people|about', re.I))
+    # Check for logo alt text
+    logo = soup.find('img', {'class': BRAND_LOGO_RE})
+    if logo and logo.get('alt'):
+        return logo.get('alt')
         
-        for section in team_sections:
-            # Look for person cards or list items
-            person_elems = section.find_all(class_=re.compile(r'card|member|person|profile', re.I))
-            
-            if not person_elems:
-                # Try finding them in list items
-                person_elems = section.find_all('li')
-            
-            for person in person_elems:
-                name = ""
-                role = ""
-                email = ""
-                
-                # Try to extract name
-                name_elem = person.find(['h3', 'h4', 'h5', 'strong', 'b'])
-                if name_elem:
-                    name = name_elem.text.strip()
-                
-                # Try to extract role
-                role_elem = person.find(class_=re.compile(r'role|position|title', re.I))
-                if role_elem:
-                    role = role_elem.text.strip()
-                else:
-                    # Look for paragraph or span that might contain the role
-                    role_elem = person.find(['p', 'span'])
-                    if role_elem and role_elem != name_elem:
-                        role = role_elem.text.strip()
+    # Return title as fallback
+    return soup.title.text.strip() if soup.title else ""
+
+def _extract_phone(soup, base_url, page_text, links, nodes):
+    """Extract the first valid phone number from the page text or tel: links"""
+    if page_text is None:
+        page_text = soup.get_text(' ', strip=True)
+    
+    # Look for phone pattern in text, in order of pattern priority, stopping at the first valid match
+    for pattern in PHONE_PATTERNS:
+        for match in pattern.finditer(page_text):
+            if is_valid_phone(match.group(0)):
+                return match.group(0)
                 
-                # Try to extract email
-                email_elem = person.find('a', href=re.compile(r'^mailto:'))
-                if email_elem:
-                    email = email_elem['href'].replace('mailto:', '')
+    # Look for elements with tel: links
+    if links is None:
+        links = soup.find_all('a', href=True)
+    tel_links = [link for link in links if TEL_RE.match(link['href'])]
+    if tel_links:
+        for link in tel_links:
+            phone = link['href'].replace('tel:', '')
+            if is_valid_phone(phone):
+                return phone
                 
-                if name:  # Only add if we have at least a name
-                    person_info = {"שם": name}
-                    if role:
-                        person_info["תפקיד"] = role
-                    if email:
-                        person_info["דוא\"ל"] = email
-                    team.append(person_info)
-            
-            # If we found team members, return them
-            if team:
-                return team
+    return ""
+
+def _extract_email(soup, base_url, page_text, links, nodes):
+    """Extract the first valid email address from mailto: links or the page text"""
+    if links is None:
+        links = soup.find_all('a', href=True)
+    
+    # Look for mailto links
+    mailto_links = [link for link in links if MAILTO_RE.match(link['href'])]
+    if mailto_links:
+        for link in mailto_links:
+            email = link['href'].replace('mailto:', '').split('?')[0]
+            if is_valid_email(email):
+                return email
+    
+    # Look for email patterns in text
+    if page_text is None:
+        page_text = soup.get_text(' ', strip=True)
+    
+    for match in EMAIL_RE.finditer(page_text):
+        if is_valid_email(match.group(0)):
+            return match.group(0)
         
-        return []
-    
-    # Social media links extraction
-    elif field_name == "קישורים לרשתות":
-        social_links = {}
-        social_patterns = {
-            'facebook': r'facebook\.com',
-            'twitter': r'twitter\.com|x\.com',
-            'instagram': r'instagram\.com',
-            'linkedin': r'linkedin\.com',
-            'youtube': r'youtube\.com',
-            'tiktok': r'tiktok\.com',
-            'whatsapp': r'wa\.me|whatsapp\.com'
-        }
+    return ""
+
+def _extract_address(soup, base_url, page_text, links, nodes):
+    """Extract the business address from meta tags, schema.org markup or address-like elements"""
+    if nodes is None:
+        nodes = collect_nodes(soup)
+    
+    # Look for address in meta tags
+    meta_address = soup.find('meta', {'property': META_ADDRESS_RE})
+    if meta_address and meta_address.get('content'):
+        return meta_address.get('content')
+    
+    # Look for address in schema.org markup
+    address_elem = soup.find('span', {'itemprop': 'address'})
+    if address_elem:
+        return address_elem.text.strip()
         
-        # Find all links
-        links = soup.find_all('a', href=True)
-        for link in links:
-            href = link['href']
+    # Look for common address patterns in Israel (city names followed by street)
+    for elem in nodes['text_blocks']:
+        text = elem.text.strip()
+        # Check if text contains a city name and looks like an address
+        if 10 < len(text) < 100 and CITIES_RE.search(text):
+            return text
+    
+    # Look for elements with address in class or id
+    address_elems = nodes['address']
+    
+    for elem in address_elems:
+        text = elem.text.strip()
+        if 5 < len(text) < 150:
+            return text
+                
+    return ""
+
+def _extract_hours(soup, base_url, page_text, links, nodes):
+    """Extract the opening hours from hours-related elements or an hours table"""
+    if nodes is None:
+        nodes = collect_nodes(soup)
+    
+    # Look for common patterns for hours
+    hours_elems = nodes['hours']
+    
+    # Check elements with hours-related classes/ids
+    for elem in hours_elems:
+        text = elem.text.strip()
+        # Check if the text contains day names and time patterns
+        if DAYS_RE.search(text) and TIME_RE.search(text):
+            # Clean up and format the hours
+            lines = [line for line in map(str.strip, text.split('\n')) if line]
+            return "\n".join(lines)
             
-            # Check if the link is a social media link
-            for platform, pattern in social_patterns.items():
-                if re.search(pattern, href):
-                    # Resolve relative URLs
-                    if not href.startswith(('http://', 'https://')):
-                        href = urljoin(base_url, href)
+    # Look for table with days and hours
+    for table in soup.find_all('table'):
+        rows = table.find_all('tr')
+        if 3 <= len(rows) <= 8:  # Typical number of rows for hours table
+            # Find the cells of each row once, they are reused to build the result
+            row_cells = [row.find_all(['td', 'th']) for row in rows]
+            for cells in row_cells:
+                if cells and DAYS_RE.search(cells[0].text):
+                    hours = []
+                    for row in row_cells:
+                        row_text = " ".join([cell.text.strip() for cell in row])
+                        if row_text:
+                            hours.append(row_text)
+                    return "\n".join(hours)
                     
-                    social_links[platform] = href
-                    break
-        
-        return social_links
-    
-    # Business domain/field extraction
-    elif field_name == "תחומי עיסוק" or field_name == "תחום פעילות" or field_name == "תחום התמחות":
-        # Check meta tags
-        meta_keywords = soup.find('meta', {'name': 'keywords'})
-        if meta_keywords and meta_keywords.get('content'):
-            keywords = [k.strip() for k in meta_keywords.get('content').split(',')]
-            if keywords:
-                return keywords
-        
-        # Check for lists of services/specialties
-        service_headers = soup.find_all(['h2', 'h3'], string=re.compile(r'שירותים|תחומי|התמחויות|פעילות', re.I))
+    return ""
+
+def _extract_team(soup, base_url, page_text, links, nodes):
+    """Extract the team members (name, role, email) from team sections"""
+    if nodes is None:
+        nodes = collect_nodes(soup)
+    
+    team = []
+    # Look for team sections
+    team_sections = nodes['team']
+    
+    for section in team_sections:
+        for person in _find_people(section):
+            name_elem, role_elem, text_elem, email_elem = _read_person(person)
+            name = name_elem.text.strip() if name_elem else ""
+            role = ""
+            email = ""
+            
+            # Prefer an element marked as the role, else a paragraph or span that might contain it
+            if role_elem:
+                role = role_elem.text.strip()
+            elif text_elem and text_elem != name_elem:
+                role = text_elem.text.strip()
+            
+            if email_elem:
+                email = email_elem['href'].replace('mailto:', '')
+            
+            if name:  # Only add if we have at least a name
+                person_info = {"שם": name}
+                if role:
+                    person_info["תפקיד"] = role
+                if email:
+                    person_info["דוא\"ל"] = email
+                team.append(person_info)
         
-        for header in service_headers:
-            # Find the next list or div with potential services
-            next_elem = header.find_next(['ul', 'div', 'section'])
-            if next_elem:
-                # If it's a list, get the list items
-                if next_elem.name == 'ul':
-                    services = [li.text.strip() for li in next_elem.find_all('li')]
-                    if services:
-                        return services
-                # If it's a div, look for paragraphs or headers inside
-                elif next_elem.name in ['div', 'section']:
-                    services = []
-                    for item in next_elem.find_all(['p', 'h4', 'h5', 'span']):
-                        text = item.text.strip()
-                        if 5 < len(text) < 100:  # Reasonable length for a service description
-                            services.append(text)
-                    if services:
-                        return services
+        # If we found team members, return them
+        if team:
+            return team
+    
+    return []
+
+def _find_people(section):
+    """Find the person cards of a team section in one walk, falling back to its list items"""
+    person_elems = []
+    list_items = []
+    for element in section.descendants:
+        if not isinstance(element, Tag):
+            continue
+        if element.name == 'li':
+            list_items.append(element)
+        classes = element.get('class')
+        if classes and PERSON_RE.search(' '.join(classes)):
+            person_elems.append(element)
+    return person_elems or list_items
+
+def _read_person(person):
+    """
+    Find the name, role, role-candidate text and mailto elements of a person card in one walk
+    
+    Each is the first matching descendant, like separate find() calls would return.
+    """
+    name_elem = role_elem = text_elem = email_elem = None
+    for element in person.descendants:
+        if not isinstance(element, Tag):
+            continue
+        tag = element.name
+        if name_elem is None and tag in NAME_TAGS:
+            name_elem = element
+        if role_elem is None:
+            classes = element.get('class')
+            if classes and ROLE_RE.search(' '.join(classes)):
+                role_elem = element
+        if text_elem is None and tag in ('p', 'span'):
+            text_elem = element
+        if email_elem is None and tag == 'a' and MAILTO_RE.match(element.get('href') or ''):
+            email_elem = element
+        # The text candidate only matters when there is no role element
+        if name_elem is not None and role_elem is not None and email_elem is not None:
+            break
+    return name_elem, role_elem, text_elem, email_elem
+
+def _extract_social_links(soup, base_url, page_text, links, nodes):
+    """Extract links to social media profiles, keyed by platform"""
+    social_links = {}
+    if links is None:
+        links = soup.find_all('a', href=True)
+    
+    for link in links:
+        href = link['href']
         
-        # As a fallback, check for meta description
-        meta_desc = soup.find('meta', {'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            return meta_desc.get('content')
-            
-        return ""
+        # Check if the link is a social media link
+        for platform, pattern in SOCIAL_PATTERNS.items():
+            if pattern.search(href):
+                # Resolve relative URLs
+                if not href.startswith(('http://', 'https://')):
+                    href = urljoin(base_url, href)
+                
+                social_links[platform] = href
+                break
+    
+    return social_links
+
+def _extract_domains(soup, base_url, page_text, links, nodes):
+    """Extract the business domains from meta keywords, a services list or the meta description"""
+    # Check meta tags
+    meta_keywords = soup.find('meta', {'name': 'keywords'})
+    if meta_keywords and meta_keywords.get('content'):
+        keywords = [k.strip() for k in meta_keywords.get('content').split(',')]
+        if keywords:
+            return keywords
+    
+    # Check for lists of services/specialties
+    service_headers = soup.find_all(['h2', 'h3'], string=SERVICES_HEADER_RE)
+    
+    for header in service_headers:
+        # Find the next list or div with potential services
+        next_elem = header.find_next(['ul', 'div', 'section'])
+        if next_elem:
+            # If it's a list, get the list items
+            if next_elem.name == 'ul':
+                services = [li.text.strip() for li in next_elem.find_all('li')]
+                if services:
+                    return services
+            # If it's a div, look for paragraphs or headers inside
+            elif next_elem.name in ['div', 'section']:
+                services = []
+                for item in next_elem.find_all(['p', 'h4', 'h5', 'span']):
+                    text = item.text.strip()
+                    if 5 < len(text) < 100:  # Reasonable length for a service description
+                        services.append(text)
+                if services:
+                    return services
     
-    # Default fallback: return empty result
+    # As a fallback, check for meta description
+    meta_desc = soup.find('meta', {'name': 'description'})
+    if meta_desc and meta_desc.get('content'):
+        return meta_desc.get('content')
+        
     return ""
+
+# Extractor per normalized field name (see normalize_field_name), including the alternative
+# names profiles use for the same data
+FIELD_EXTRACTORS = {
+    "שם העסק": _extract_business_name,
+    "טלפון": _extract_phone,
+    "דוא\"ל": _extract_email,
+    "כתובת": _extract_address,
+    "שעות פעילות": _extract_hours,
+    "שעות פתיחה": _extract_hours,
+    "שעות קבלה": _extract_hours,
+    "צוות": _extract_team,
+    "רופאים": _extract_team,
+    "קישורים לרשתות": _extract_social_links,
+    "תחומי עיסוק": _extract_domains,
+    "תחום פעילות": _extract_domains,
+    "תחום התמחות": _extract_domains
+}
+
+# Extractors that scan the page text
+TEXT_EXTRACTORS = frozenset((_extract_phone, _extract_email))
+
+# Extractors that read the page links. _extract_phone only falls back to them when the page
+# text has no valid number, so it collects them itself in that case
+LINK_EXTRACTORS = frozenset((_extract_email, _extract_social_links))
+
+# Extractors that read the candidate elements from collect_nodes
+NODE_EXTRACTORS = frozenset((_extract_address, _extract_hours, _extract_team))
@@ -1,12 +1,32 @@
 import json
 import os
 import re
+import unicodedata
+from functools import lru_cache
 from urllib.parse import urlparse
 
+# Browser-like headers sent with every request
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+}
+
+# Quote marks used interchangeably in Hebrew abbreviations like דוא"ל: ASCII quotes,
+# geresh/gershayim and typographic quotes all become a plain double quote
+FIELD_NAME_QUOTES = str.maketrans({char: '"' for char in "'\u05f3\u05f4\u201c\u201d\u2018\u2019"})
+
+# Precompiled email validation pattern
+EMAIL_VALID_RE = re.compile(r'^[\w\.-]+@[\w\.-]+\.\w+$')
+
+@lru_cache(maxsize=1)
 def load_profiles():
     """
     Load profile configurations from JSON file
     
+    The file is read once per process and the same object is returned on
+    every call, so copy it before modifying it.
+    
     Returns:
         dict: Profile configurations
     """
@@ -39,10 +59,14 @@ def load_profiles():
             }
         }
 
+@lru_cache(maxsize=1)
 def load_fields():
     """
     Load field configurations from JSON file
     
+    The file is read once per process and the same object is returned on
+    every call, so copy it before modifying it.
+    
     Returns:
         list: Field configurations
     """
@@ -92,6 +116,7 @@ def validate_url(url):
     except:
         return False
 
+@lru_cache(maxsize=4096)
 def is_valid_email(email):
     """
     Validate email format
@@ -106,9 +131,9 @@ def is_valid_email(email):
         return False
         
     # Simple regex for email validation
-    pattern = r'^[\w\.-]+@[\w\.-]+\.\w+$'
-    return bool(re.match(pattern, email))
+    return bool(EMAIL_VALID_RE.match(email))
 
+@lru_cache(maxsize=4096)
 def is_valid_phone(phone):
     """
     Validate phone number format
@@ -122,14 +147,33 @@ def is_valid_phone(phone):
     if not phone:
         return False
         
-    # Remove common separators and spaces
-    clean_phone = re.sub(r'[\s\-\(\)\.]+', '', phone)
+    # Count digits, skipping common separators and spaces; a single + may lead the number
+    digits = 0
+    plus_allowed = True
+    for char in phone:
+        if char.isdecimal():
+            digits += 1
+            plus_allowed = False
+        elif char == '+' and plus_allowed:
+            plus_allowed = False
+        elif char not in '-().' and not char.isspace():
+            return False
     
-    # Check if it's mostly digits
-    if not re.match(r'^\+?[\d]{7,15}$', clean_phone):
-        return False
+    # Check if it's 7-15 digits
+    return 7 <= digits <= 15
+
+@lru_cache(maxsize=256)
+def normalize_field_name(field_name):
+    """
+    Normalize a field name so that spelling variants of the same field compare equal
+    
+    Args:
+        field_name (str): Field name as written in a profile
         
-    return True
+    Returns:
+        str: NFKC-normalized name with every quote mark replaced by a double quote
+    """
+    return unicodedata.normalize('NFKC', field_name).translate(FIELD_NAME_QUOTES).strip()
 
 def ensure_dirs():
     """